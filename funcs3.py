@@ -6,14 +6,21 @@ Functions:
     funcs3_min_version_check - Checker for funcs3 module min version
     setuplogging             - Set up default logger (use if not using loadconfig)
     loadconfig, getcfg       - Config file handlers
+    getcfg_list              - Get a comma/whitespace separated list config param as a tuple
     timevalue, retime        - Handling time values used in config files
     requestlock, releaselock - Cross-tool/process safety handshake
+    run_scheduled            - Run periodic jobs in one long-running process
     snd_notif, snd_email     - Send text and email messages
+    snd_email_many           - Send a batch of email messages over one connection
+    close_smtp               - Close the SMTP connections held open for reuse
+    resolve_recipients       - Resolve a snd_email 'to' parameter to a tuple of addresses
+    make_sender              - Make a send function for repeatedly emailing the same recipients
+    snd_notif_async, snd_email_async - asyncio versions of snd_notif and snd_email
 
     Import this module from the main script as follows:
         from funcs3 import *
       or import specific items as needed:
-        from funcs3 import PROGDIR, loadconfig, getcfg, cfg, timevalue, retime, setuplogging, logging, funcs3_min_version_check, funcs3_version, snd_notif, snd_email, requestlock, releaselock, ConfigError, SndEmailError
+        from funcs3 import PROGDIR, loadconfig, getcfg, getcfg_list, cfg, timevalue, retime, setuplogging, logging, funcs3_min_version_check, funcs3_version, snd_notif, snd_email, snd_email_many, close_smtp, resolve_recipients, make_sender, snd_notif_async, snd_email_async, requestlock, releaselock, run_scheduled, ConfigError, SndEmailError
 Globals:
     cfg - Dictionary that contains the info read from the config file
     PROGDIR - A string var that contains the full path to the main
@@ -21,12 +28,15 @@ Globals:
         from a different pwd, such as when running from cron.
 """
 
-funcs3_version = "V1.1 220412"
+funcs3_version = "V1.2 261014"
 
 #==========================================================
 #
 #  Chris Nelson, 2018-2022
 #
+# V1.2  261014  Config file caching and faster parsing, SMTP connection reuse, added getcfg_list,
+#                 snd_email_many, close_smtp, resolve_recipients, make_sender, snd_notif_async, snd_email_async
+#                 and run_scheduled
 # V1.1  220412  Added timevalue and retime
 # V1.0  220203  V1.0 baseline
 # ...
@@ -38,12 +48,11 @@ funcs3_version = "V1.1 220412"
 
 import sys
 import time
+import atexit
 import os.path
-import io
-import smtplib
-from email.mime.text import MIMEText
 import logging
-import tempfile
+import functools
+import threading
 import re
 import __main__
 
@@ -58,6 +67,13 @@ cfg = {}
 PROGDIR = os.path.dirname(os.path.realpath(__main__.__file__)) + "/"
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_under_progdir(path):
+    """Return path if absolute, else path relative to PROGDIR.
+    """
+    return path  if os.path.isabs(path)  else os.path.join(PROGDIR, path)
+
+
 #=====================================================================================
 #=====================================================================================
 #  Module exceptions
@@ -93,16 +109,22 @@ class SndEmailError(Error):
 #  funcs3 minimum version check
 #=====================================================================================
 #=====================================================================================
+def _version_tuple(version):
+    """Return version string such as "V1.10 220412" or "1.1" as a tuple of ints, eg (1, 10).
+    """
+    return tuple(int(x) for x in str(version).lstrip("Vv").split()[0].split("."))
+
+_PARSED_VERSION = _version_tuple(funcs3_version)
+
 def funcs3_min_version_check(min_version):
     """Compare current funcs3 module version against passed in minimum expected version.
 
     min_version
-        Int or float
+        Int, float, or version string (eg 1, 1.1, or "1.10")
     
     Return True if current version >= passed-in min version, else False
     """
-    current_version = float(funcs3_version[1:4])
-    return True  if current_version >= min_version  else False
+    return _PARSED_VERSION >= _version_tuple(min_version)
 
 
 #=====================================================================================
@@ -122,21 +144,26 @@ def setuplogging (loglevel, logfile=None):
     Returns nothing
     """
 
+    if logging.getLogger().handlers:
+        return                              # As for basicConfig, no change if already set up.  Don't open the logfile.
+
     if logfile == None:
-        try:
-            log_format = __main__.CONSOLE_LOGGING_FORMAT
-        except:
-            log_format = CONSOLE_LOGGING_FORMAT
-        logging.basicConfig(level=loglevel, format=log_format, style='{')
+        handler = logging.StreamHandler()
+        handler.setFormatter(_log_formatter("CONSOLE_LOGGING_FORMAT"))
     else:
-        try:
-            log_format = __main__.FILE_LOGGING_FORMAT
-        except:
-            log_format = FILE_LOGGING_FORMAT
-        logpath = logfile
-        if not os.path.isabs(logpath):
-            logpath = os.path.join(PROGDIR, logpath)
-        logging.basicConfig(level=loglevel, filename=logpath, format=log_format, style='{')
+        handler = logging.FileHandler(_resolve_under_progdir(logfile), "a")
+        handler.setFormatter(_log_formatter("FILE_LOGGING_FORMAT"))
+    logging.basicConfig(level=loglevel, handlers=[handler])
+
+
+@functools.lru_cache(maxsize=4)
+def _log_formatter(format_name):
+    """Return the logging.Formatter for format_name ("CONSOLE_LOGGING_FORMAT" or "FILE_LOGGING_FORMAT").
+    A same-named constant in the main script overrides the funcs3 default.  Built once per format
+    since the main script's constants don't change after it has started logging.
+    """
+    log_format = getattr(__main__, format_name, globals()[format_name])
+    return logging.Formatter(fmt=log_format, style='{')
 
 
 #=====================================================================================
@@ -145,9 +172,12 @@ def setuplogging (loglevel, logfile=None):
 #=====================================================================================
 #=====================================================================================
 cfgline = re.compile(r"([^\s=:]+)[\s=:]+(.+)")
-_config_timestamp = 0
+_SEP_TABLE = str.maketrans("=:", "  ")     # Key/value delimiters other than whitespace
+_CFG_SLURP_LIMIT  = 1024*1024   # Config files up to this size (bytes) are read in one go
+_cfg_file_cache   = {}      # {abs_path: (mtime_ns, size)} for the current top-level config file
 _current_loglevel = None
 _current_logfile  = None
+_MISSING = object()         # getcfg no-default sentinel
 
 def loadconfig(cfgfile      = 'config.cfg',
         cfgloglevel         = DEFAULT_LOGGING_LEVEL,
@@ -172,16 +202,15 @@ def loadconfig(cfgfile      = 'config.cfg',
     flush_on_reload
         If the config file will be reloaded (due to being changed) then clean out cfg first
     force_flush_reload
-        Forces cfg to be cleaned out and the config file to be reloaded
+        Forces cfg to be cleaned out and the config file (and any imports) to be reloaded
     isimport
         Internally set True when handling imports.  Not used by top-level scripts.
 
     Returns True if cfg has been (re)loaded, and False if not reloaded, so that the
     caller can do processing only if the cfg is freshly loaded.
 
-    A ConfigError is raised if there are file access or parsing issues.
+    A ConfigError is raised if there are file access or parsing issues, or if EmailServerPort is invalid.
     """
-    global _config_timestamp
     global cfg
     global _current_loglevel
     global _current_logfile
@@ -198,90 +227,58 @@ def loadconfig(cfgfile      = 'config.cfg',
         logging.getLogger().setLevel(cfgloglevel)           # logging within loadconfig is always done at cfgloglevel
         _current_loglevel = cfgloglevel
         logging.debug("cfg dictionary flushed and forced reloaded (force_flush_reload)")
-        cfg.clear()
-        _config_timestamp = 0
 
-    config = cfgfile
-    if not os.path.isabs(config):
-        config = os.path.join(PROGDIR, config)
+    config = _resolve_under_progdir(cfgfile)
 
-    if not os.path.exists(config):
+    try:
+        st = os.stat(config)                                # One stat for both the existence and change checks
+    except FileNotFoundError:
         _msg = f"Config file <{config}> not found."
-        raise ConfigError (_msg)
+        raise ConfigError (_msg) from None
+    except Exception as e:
+        _msg = f"Failed while attempting to open/read config file <{config}>.\n  {e}"
+        raise ConfigError (_msg) from None
 
-    try:
-        if not isimport:        # Top level config file
-            current_timestamp = os.path.getmtime(cfgfile)
-            if _config_timestamp == current_timestamp:
-                return False
-
-            # Initial load call, or config file has changed.  Do (re)load.
-            _config_timestamp = current_timestamp
-            logging.getLogger().setLevel(cfgloglevel)   # Set logging level for remainder of loadconfig call
+    if isimport:
+        _parse_cfgfile(config, cfg)
+    else:                       # Top level config file
+        if not force_flush_reload  and  _cfg_file_cache.get(config) == (st.st_mtime_ns, st.st_size):
+            return False                                    # Unchanged file - no reload
+        else:
+            # Initial load call, config file has changed, or forced.  Do (re)load.
+            # A forced reload always re-reads, so that changes in imported files are picked up.
+            logging.getLogger().setLevel(cfgloglevel)       # Set logging level for remainder of loadconfig call
             _current_loglevel = cfgloglevel
 
-            if flush_on_reload:
-                cfg.clear()
-                logging.debug (f"cfg dictionary flushed and reloaded due to changed config file (flush_on_reload)")
+            parsed = {}
+            _parse_cfgfile(config, parsed)                  # Parse fully before touching cfg
+            cfg_port = parsed.get("EmailServerPort", _MISSING)
+            if cfg_port is not _MISSING  and  cfg_port not in _PORT_DISPATCH:      # Fail fast rather than at the first snd_email
+                _msg = f"Config EmailServerPort <{cfg_port}> is invalid.  Must be one of {', '.join(_PORT_DISPATCH)}."
+                raise ConfigError (_msg)
 
-        logging.info (f"Loading {config}")
-        with io.open(config, encoding='utf8') as ifile:
-            for line in ifile:
-                if line.strip().lower().startswith("import"):           # Is an import line
-                    line = line.split("#", maxsplit=1)[0].strip()
-                    target = os.path.expanduser(line.split()[1])
-                    if os.path.exists(target):
-                        loadconfig(target, cfgloglevel, isimport=True)
-                    else:
-                        _msg = f"Could not find and import <{target}>"
-                        raise ConfigError (_msg)
-                else:                                                   # Is a param/key line
-                    _line = line.split("#", maxsplit=1)[0].strip()
-                    if len(_line) > 0:
-                        out = cfgline.match(_line)
-                        if out:
-                            key = out.group(1)
-                            rol = out.group(2)  # rest of line
-                            isint = False
-                            try:
-                                cfg[key] = int(rol)         # add int to dict
-                                isint = True
-                            except:
-                                pass
-                            if not isint:
-                                if rol.lower() == "true":   # add bool to dict
-                                    cfg[key] = True
-                                elif rol.lower() == "false":
-                                    cfg[key] = False
-                                else:
-                                    cfg[key] = rol          # add string to dict
-                            logging.debug (f"Loaded {key} = <{cfg[key]}>  ({type(cfg[key])})")
-                        else: logging.warning (f"loadconfig:  Error on line <{line}>.  Line skipped.")
-
-
-    except Exception as e:
-        _msg = f"Failed while attempting to open/read config file <{config}>.\n  {e}"
-        raise ConfigError (_msg) from None
+            if flush_on_reload or force_flush_reload:
+                cfg.clear()
+                if flush_on_reload:
+                    logging.debug (f"cfg dictionary flushed and reloaded due to changed config file (flush_on_reload)")
+            cfg.update(parsed)
+            _cfg_file_cache.clear()                         # Only the latest top-level config file is current
+            _cfg_file_cache[config] = (st.st_mtime_ns, st.st_size)
 
     # Operations only for finishing a top-level call
     if not isimport:
         if not cfglogfile_wins:
             config_logfile  = getcfg("LogFile", None)
             if config_logfile is not None:
-                if not os.path.isabs(config_logfile):
-                    config_logfile = os.path.join(PROGDIR, config_logfile)
+                config_logfile = _resolve_under_progdir(config_logfile)
             logger = logging.getLogger()
             if config_logfile != _current_logfile:
                 if config_logfile is None:
                     logging.error("Changing the LogFile from a real file to None (console) is not supported.  Aborting.")
                     sys.exit()
                 logger.handlers.clear()
-                try:
-                    log_format = __main__.FILE_LOGGING_FORMAT
-                except:
-                    log_format = FILE_LOGGING_FORMAT
                 handler = logging.FileHandler(config_logfile, "a")
-                handler.setFormatter(logging.Formatter(fmt=log_format, style='{'))
+                handler.setFormatter(_log_formatter("FILE_LOGGING_FORMAT"))
                 logger.addHandler(handler)
                 _current_logfile = config_logfile
                 logging.info (f"Logging file  changed to <{config_logfile}>")
@@ -306,7 +303,80 @@ def loadconfig(cfgfile      = 'config.cfg',
     return True
 
 
-def getcfg(param, default="__nodefault__"):
+def _parse_cfgfile(config, target):
+    """Parse config file (and any nested imports) into the target dictionary.
+
+    Raises ConfigError if there are file access or parsing issues.
+    """
+    log_debug   = logging.debug
+    log_warning = logging.warning
+    _dbg = logging.getLogger().isEnabledFor(logging.DEBUG)     # Skip building the per-key debug messages if not logged
+    try:
+        logging.info (f"Loading {config}")
+        with open(config, 'rb') as ifile:
+            if os.fstat(ifile.fileno()).st_size > _CFG_SLURP_LIMIT:
+                lines = ifile                                           # Stream very large files
+            else:
+                lines = ifile.read().splitlines()
+            for raw in lines:
+                # Work on the raw bytes up to any '#' so that blank and comment lines are never decoded
+                body = raw.partition(b'#')[0].strip()
+                if not body:
+                    continue
+                if body[:7].lower() in (b'import ', b'import\t'):   # Is an import line
+                    target_file = os.path.expanduser(body.decode('utf8').split()[1])
+                    if os.path.exists(target_file):
+                        _parse_cfgfile(target_file, target)
+                    else:
+                        _msg = f"Could not find and import <{target_file}>"
+                        raise ConfigError (_msg)
+                else:                                                   # Is a param/key line
+                    _line = body.decode('utf8').strip()
+                    if not _line:
+                        continue
+                    # Fast path - the key ends at the first whitespace, '=' or ':'.  The translate
+                    # preserves the line length so the rest of line can be sliced from _line.
+                    parts = _line.translate(_SEP_TABLE).split(None, 1)
+                    if len(parts) == 2  and  _line[0] not in "=:":
+                        key = parts[0]
+                        rol = _line[-len(parts[1]):]                    # rest of line
+                    else:
+                        out = cfgline.match(_line)                      # Odd cases such as "key =" or "=value"
+                        if not out:
+                            log_warning (f"loadconfig:  Error on line <{raw.decode('utf8').rstrip()}>.  Line skipped.")
+                            continue
+                        key = out.group(1)
+                        rol = out.group(2)
+                    key = sys.intern(key)                               # Share identity with literal keys in the code
+                    target[key] = _coerce(rol)
+                    if _dbg:
+                        log_debug (f"Loaded {key} = <{target[key]}>  ({type(target[key])})")
+
+    except Exception as e:
+        _msg = f"Failed while attempting to open/read config file <{config}>.\n  {e}"
+        raise ConfigError (_msg) from None
+
+
+def _coerce(rol):
+    """Return the config value string rol as an int, bool, or (otherwise) the string itself.
+    """
+    digits = rol[1:]  if rol[:1] in ("+", "-")  else rol
+    if digits.isdecimal():
+        return int(rol)                             # int
+    if "_" in digits:                               # int() also accepts "1_000"
+        try:
+            return int(rol)
+        except ValueError:
+            pass
+    low = rol.lower()
+    if low == "true":                               # bool
+        return True
+    if low == "false":
+        return False
+    return rol                                      # string
+
+
+def getcfg(param, default=_MISSING):
     """Get a param from the cfg dictionary.
 
     Returns the value of param from the cfg dictionary.  Equivalent to just referencing cfg[]
@@ -320,15 +390,37 @@ def getcfg(param, default="__nodefault__"):
     Raises ConfigError if param does not exist in cfg and no default provided.
     """
     
-    try:
-        return cfg[param]
-    except:
-        if default != "__nodefault__":
-            return default
+    value = cfg.get(param, _MISSING)
+    if value is not _MISSING:
+        return value
+    if default is not _MISSING:
+        return default
     _msg = f"getcfg - Config parameter <{param}> not in cfg and no default."
     raise ConfigError (_msg)
 
 
+def getcfg_list(param, default=_MISSING):
+    """Get a list param from the cfg dictionary, such as EmailTo.
+
+    Returns a tuple of the comma or whitespace separated items in the value of param.
+    The split is cached on the value string, so repeated calls are a dict lookup.
+
+    param
+        String name of param/key to be fetched from cfg
+    default
+        if provided, is returned (as is) if the param doesn't exist in cfg
+
+    Raises ConfigError if param does not exist in cfg and no default provided.
+    """
+
+    value = cfg.get(param, _MISSING)
+    if value is _MISSING:
+        return getcfg(param, default)       # default untouched, or ConfigError
+    if isinstance(value, str):
+        return _split_list(value)
+    return (value,)                         # Single int or bool value
+
+
 class timevalue():
     def __init__(self, original):
         """Convert short time value string/int/float in resolution seconds, minutes, hours, days,
@@ -414,6 +506,57 @@ def retime(time_sec, unitC):
 
 LOCKFILE_DEFAULT = "funcs3_LOCK"
 LOCK_TIMEOUT     = 5                # seconds
+_IN_DELETE       = 0x00000200       # inotify event/flag values from <sys/inotify.h>
+_IN_MOVED_FROM   = 0x00000040
+_IN_NONBLOCK     = getattr(os, "O_NONBLOCK", 0)    # IN_NONBLOCK/IN_CLOEXEC are the O_ values for the platform.
+_IN_CLOEXEC      = getattr(os, "O_CLOEXEC", 0)     #   (Not defined on Windows, where inotify isn't used.)
+
+@functools.lru_cache(maxsize=None)
+def _tmpdir():
+    """Return the system temp dir.  tempfile is imported on first use only.
+    """
+    import tempfile
+    return tempfile.gettempdir()
+
+
+@functools.lru_cache(maxsize=32)
+def _lock_path(lockfile):
+    """Return the full path of lockfile in the system temp dir.
+    """
+    return os.path.join(_tmpdir(), lockfile)
+
+
+def _lock_watch(lock_dir):
+    """Return an inotify file descriptor watching lock_dir for file deletes, or None if
+    inotify is not available (non-Linux), in which case the caller polls.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(lock_dir), _IN_DELETE | _IN_MOVED_FROM) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except Exception:
+        return None
+
+
+def _lock_wait(watch_fd, timeout):
+    """Wait up to timeout seconds for a delete event on the _lock_watch inotify fd.
+    """
+    import select
+    if select.select([watch_fd], [], [], timeout)[0]:
+        try:
+            while os.read(watch_fd, 4096):          # Drain the pending events
+                pass
+        except BlockingIOError:
+            pass
+
 
 def requestlock(caller, lockfile=LOCKFILE_DEFAULT, timeout=LOCK_TIMEOUT):
     """Lock file request.
@@ -425,30 +568,53 @@ def requestlock(caller, lockfile=LOCKFILE_DEFAULT, timeout=LOCK_TIMEOUT):
     timeout
         Default 5s
 
+    On Linux, waiting for an existing lock to be released uses inotify so that the lock
+    is taken as soon as the holder releases it.  Elsewhere the lock file is polled every 0.1s.
+
     Returns
         0:  Lock request successful
        -1:  Lock request failed.  Warning level log messages are generated.
     """
-    lock_file = os.path.join(tempfile.gettempdir(), lockfile)
+    lock_file = _lock_path(lockfile)
 
     xx = time.time() + timeout
-    while True:
-        if not os.path.exists(lock_file):
+    watch_tried = False
+    watch_fd = None
+    try:
+        while True:
             try:
-                with io.open(lock_file, 'w', encoding='utf8') as ofile:
-                    ofile.write(f"Locked by <{caller}> at {time.asctime(time.localtime())}.")
-                    logging.debug (f"LOCKed by <{caller}> at {time.asctime(time.localtime())}.")
-                return 0
+                fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                remaining = xx - time.time()
+                if remaining <= 0:
+                    break
+                if not watch_tried:
+                    watch_tried = True
+                    watch_fd = _lock_watch(os.path.dirname(lock_file))
+                    if watch_fd is not None:
+                        continue                    # Recheck - lock may have been released before the watch was set
+                if watch_fd is None:
+                    time.sleep(0.1)
+                else:
+                    _lock_wait(watch_fd, remaining)
+                continue
             except Exception as e:
                 logging.warning(f"Unable to create lock file <{lock_file}>\n  {e}")
                 return -1
-        else:
-            if time.time() > xx:
-                break
-        time.sleep(0.1)
+
+            ts = time.asctime(time.localtime())
+            try:
+                os.write(fd, f"Locked by <{caller}> at {ts}.".encode('utf8'))
+            finally:
+                os.close(fd)
+            logging.debug ("LOCKed by <%s> at %s.", caller, ts)
+            return 0
+    finally:
+        if watch_fd is not None:
+            os.close(watch_fd)
 
     try:
-        with io.open(lock_file, encoding='utf8') as ifile:
+        with open(lock_file, encoding='utf-8', errors='replace') as ifile:
             lockedBy = ifile.read()
         logging.warning (f"Timed out waiting for lock file <{lock_file}> to be cleared.  {lockedBy}")
     except Exception as e:
@@ -469,18 +635,70 @@ def releaselock(lockfile=LOCKFILE_DEFAULT):
         0:  Lock release successful (lock file deleted)
        -1:  Lock release failed.  Warning level log messages are generated.
     """
-    lock_file = os.path.join(tempfile.gettempdir(), lockfile)
-    if os.path.exists(lock_file):
-        try:
-            os.remove(lock_file)
-        except Exception as e:
-            logging.warning (f"Unable to remove lock file <{lock_file}>\n  {e}.")
-            return -1
-        logging.debug(f"Lock file removed: <{lock_file}>")
-        return 0
-    else:
+    lock_file = _lock_path(lockfile)
+    try:
+        os.unlink(lock_file)
+    except FileNotFoundError:
         logging.warning(f"Attempted to remove lock file <{lock_file}> but the file does not exist.")
         return -1
+    except Exception as e:
+        logging.warning (f"Unable to remove lock file <{lock_file}>\n  {e}.")
+        return -1
+    logging.debug ("Lock file removed: <%s>", lock_file)
+    return 0
+
+
+#=====================================================================================
+#=====================================================================================
+#  Scheduled jobs
+#=====================================================================================
+#=====================================================================================
+
+def run_scheduled(jobs):
+    """Run periodic jobs within this process, as an alternative to separate cron entries.
+
+    jobs
+        List of (interval, function) tuples.  interval is a timevalue (eg, 300, "5m", "1h").
+        Each function is called with no arguments, first right away and then every interval.
+
+    Running the jobs in one long-running process avoids the Python startup, import, and
+    config file parsing of each cron run, and lets the jobs reuse the open SMTP connections.
+    The jobs share the cfg dictionary.  A job calling loadconfig gets False back (and cfg is
+    not touched) if the config file is unchanged since the last load.  Jobs from scripts
+    with different config files should call loadconfig with flush_on_reload=True.
+
+    A job that raises an exception (or calls sys.exit with an error code) is logged at ERROR
+    level and remains scheduled.  A job that overruns its interval skips the missed runs.
+
+    Does not return unless jobs is empty.  KeyboardInterrupt is passed up.
+    Raises ValueError for an invalid interval.
+    """
+    import sched
+
+    scheduler = sched.scheduler(time.monotonic, time.sleep)
+
+    def run_job(interval, function, due):
+        name = getattr(function, '__name__', repr(function))      # Not all callables have a __name__ (eg, functools.partial)
+        try:
+            function()
+        except Exception as e:
+            logging.error ("run_scheduled:  Job <%s> failed:\n  <%s>", name, e)
+        except SystemExit as e:
+            if e.code:
+                logging.error ("run_scheduled:  Job <%s> exited with <%s>", name, e.code)
+        due += interval
+        now = time.monotonic()
+        if due <= now:                          # Overran - skip to the next interval boundary
+            due += ((now - due) // interval + 1) * interval
+        scheduler.enterabs(due, 0, run_job, (interval, function, due))
+
+    start = time.monotonic()
+    for interval, function in jobs:
+        interval_sec = timevalue(interval).seconds
+        if interval_sec <= 0:
+            raise ValueError (f"run_scheduled:  Interval <{interval}> for job <{getattr(function, '__name__', repr(function))}> must be greater than 0")
+        scheduler.enterabs(start, 0, run_job, (interval_sec, function, start))
+    scheduler.run()
 
 
 #=====================================================================================
@@ -489,6 +707,272 @@ def releaselock(lockfile=LOCKFILE_DEFAULT):
 #=====================================================================================
 #=====================================================================================
 
+_smtp_pool          = {}        # {(EmailServer, EmailServerPort, EmailUser, thread id): [SMTP server object, time last used]}
+_SMTP_IDLE_TIMEOUT  = 60        # seconds
+_SMTP_TIMEOUT       = 30        # seconds, for each blocking socket operation (connect, reply waits)
+_SMTP_TRUST_RECENT  = 5         # seconds, a connection used more recently than this is reused without a NOOP check
+_PORT_DISPATCH      = {         # {EmailServerPort: (smtplib class name, port number, use STARTTLS)}
+    "P25":      ("SMTP",     25,  False),
+    "P465":     ("SMTP_SSL", 465, False),
+    "P587":     ("SMTP",     587, False),
+    "P587TLS":  ("SMTP",     587, True),
+    }
+
+def _smtp_pool_key():
+    """Return the _smtp_pool key for the current config email server settings.  Connections
+    are per-thread since an SMTP session can't be shared by concurrent senders (see snd_email_async).
+    """
+    return (getcfg('EmailServer'), getcfg('EmailServerPort'), cfg.get('EmailUser', _MISSING), threading.get_ident())
+
+
+def _get_smtp(conn_key):
+    """Return a connected (and logged in) SMTP server object for the conn_key email server
+    settings, reusing the pooled connection if not idle too long and it still responds.
+    A connection used within the last _SMTP_TRUST_RECENT seconds (such as within a snd_email_many
+    batch) is reused without the NOOP round trip.  A dropped connection is caught by _sendmail.
+
+    Raises ConfigError for an invalid EmailServerPort.  smtplib exceptions are passed up.
+    """
+    import smtplib
+
+    if len(_smtp_pool) > 1  or  conn_key not in _smtp_pool:
+        _prune_smtp_pool(conn_key)
+
+    pooled = _smtp_pool.get(conn_key)
+    if pooled is not None:
+        idle = time.monotonic() - pooled[1]
+        if idle < _SMTP_TRUST_RECENT:
+            return pooled[0]
+        if idle < _SMTP_IDLE_TIMEOUT:
+            try:
+                if pooled[0].noop()[0] == 250:
+                    return pooled[0]
+            except (smtplib.SMTPException, OSError):
+                pass                                # Fall through to reconnect
+        _drop_smtp(conn_key)
+
+    cfg_server, cfg_port, cfg_user, _ = conn_key
+    try:
+        smtp_class, port_num, use_starttls = _PORT_DISPATCH[cfg_port]
+    except KeyError:
+        raise ConfigError (f"Config EmailServerPort <{cfg_port}> is invalid") from None
+    server = getattr(smtplib, smtp_class)(cfg_server, port_num, timeout=_SMTP_TIMEOUT)
+    if use_starttls:
+        server.starttls()
+
+    if cfg_user is not _MISSING:
+        server.login (cfg_user, getcfg('EmailPass'))
+
+    _smtp_pool[conn_key] = [server, time.monotonic()]
+    return server
+
+
+def _prune_smtp_pool(conn_key):
+    """Close and remove the pooled connections of other threads that have ended, or that have been
+    idle for more than _SMTP_IDLE_TIMEOUT seconds (and so wouldn't be reused).  Keeps a thread that
+    sent with snd_email/snd_notif from leaving its connection open for the life of the process.
+    """
+    live_threads = {thread.ident for thread in threading.enumerate()}
+    now = time.monotonic()
+    for key, pooled in list(_smtp_pool.items()):
+        if key != conn_key  and  (key[3] not in live_threads  or  now - pooled[1] > _SMTP_IDLE_TIMEOUT):
+            _drop_smtp(key)
+
+
+def _drop_smtp(conn_key, send_quit=False):
+    """Close and remove the conn_key pooled SMTP connection, if any.  Errors are ignored.
+
+    By default the socket is just closed, since a stale or expired connection (perhaps silently
+    dropped by a NAT or firewall) could block waiting for the QUIT reply.  send_quit=True sends
+    QUIT first, for a connection known to be good.
+    """
+    pooled = _smtp_pool.pop(conn_key, None)
+    if pooled is not None:
+        try:
+            if send_quit:
+                pooled[0].quit()
+                return
+        except Exception:
+            pass
+        pooled[0].close()
+
+
+def close_smtp():
+    """Close all SMTP connections held open for reuse by snd_email, snd_notif, and snd_email_many.
+
+    Called automatically at exit.  May be called at any time - the next send reconnects.
+    """
+    for conn_key in list(_smtp_pool):
+        pooled = _smtp_pool.get(conn_key)
+        recent = pooled is not None  and  time.monotonic() - pooled[1] < _SMTP_TRUST_RECENT
+        _drop_smtp(conn_key, send_quit=recent)
+
+atexit.register(close_smtp)
+
+
+def _close_thread_smtp():
+    """Close the current thread's pooled SMTP connections.  Used by the async functions, since
+    their executor threads end with the event loop and their connections would never be reused.
+    """
+    thread_id = threading.get_ident()
+    for conn_key in list(_smtp_pool):
+        if conn_key[3] == thread_id:
+            _drop_smtp(conn_key, send_quit=True)    # Just used
+
+
+def _sendmail(from_addr, To, msg):
+    """Send one message on the pooled SMTP connection.  If the server has dropped the
+    connection then reconnect and retry once.
+
+    smtplib exceptions are passed up.  A failure of the message's own transaction (refused sender
+    or recipients, or data rejected) leaves the connection reset (smtplib sends RSET) and
+    reusable for the next message.  Any other failure closes the connection.
+    """
+    import smtplib
+
+    verbose = 1  if getcfg("EmailVerbose", False)  else 0
+    conn_key = _smtp_pool_key()
+    try:
+        server = _get_smtp(conn_key)
+        server.set_debuglevel(verbose)
+        try:
+            server.send_message(msg, from_addr, To)
+        except smtplib.SMTPServerDisconnected:      # Reused connection dropped by the server
+            _drop_smtp(conn_key)
+            server = _get_smtp(conn_key)
+            server.set_debuglevel(verbose)
+            server.send_message(msg, from_addr, To)
+    except Exception as e:
+        if not isinstance(e, (ConfigError, smtplib.SMTPSenderRefused, smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError)):
+            _drop_smtp(conn_key)                    # Connection state unknown
+        raise
+    _smtp_pool[conn_key][1] = time.monotonic()
+
+
+@functools.lru_cache(maxsize=2)
+def _asctime_for(sec):
+    """Return the time.asctime string for int seconds sec.  Batches sent in the same second
+    share one formatted timestamp.
+    """
+    return time.asctime(time.localtime(sec))
+
+
+@functools.lru_cache(maxsize=32)
+def _msg_headers(from_addr, To):
+    """Return the parsed (name, header object) From and To headers, for use by _new_message.
+    To is a tuple of addresses.
+    """
+    from email.message import EmailMessage
+    skeleton = EmailMessage()
+    skeleton['From'] = from_addr
+    skeleton['To'] = ", ".join(To)
+    return tuple(skeleton.raw_items())
+
+
+def _new_message(from_addr, To):
+    """Return a new EmailMessage with the From and To headers set.  The cached parsed headers
+    are added as-is (set_raw), so that the addresses are parsed once per (From, To) rather
+    than on every send.  The parsed header objects are immutable, so may be shared.
+    """
+    from email.message import EmailMessage
+    msg = EmailMessage()
+    for name, value in _msg_headers(from_addr, tuple(To)):
+        msg.set_raw(name, value)
+    return msg
+
+
+_MAX_7BIT_LINE = 998        # SMTP line length limit (RFC 5322), excluding the CRLF
+
+def _set_body(msg, text, subtype="plain"):
+    """Set text as the body of msg.  ASCII text within the SMTP line length limit is sent as is
+    (7bit), rather than letting the email package scan the text and quoted-printable or base64
+    encode it, as it does for any line longer than 78 characters.  Non-ASCII text is
+    quoted-printable encoded, since the email package would otherwise send short-lined text as
+    raw 8bit, which needs BODY=8BITMIME (not sent by smtplib's send_message).  Long-lined
+    ASCII text gets the email package's choice of encoding.
+    """
+    if not text.isascii():
+        msg.set_content(text, subtype=subtype, cte='quoted-printable')
+    elif max(map(len, text.splitlines()), default=0) <= _MAX_7BIT_LINE:
+        msg.set_content(text, subtype=subtype, cte='7bit')
+    else:
+        msg.set_content(text, subtype=subtype)
+
+
+_template_cache     = {}        # {path: (mtime_ns, size, text)}, only the latest version of each file
+_TEMPLATE_CACHE_MAX = 32        # paths
+
+def _read_template(path, mtime_ns, size):
+    """Return the text of the snd_email filename/htmlfile path.  Cached with the file's mtime and size
+    so that a file sent repeatedly is read once, and re-read if it changes.  Only the latest version
+    of each file is kept, so a growing log file sent repeatedly doesn't pile up copies.  Bytes that
+    are not valid UTF-8 (such as in a log file being sent) are replaced rather than failing the send.
+    """
+    cached = _template_cache.get(path)
+    if cached is not None  and  cached[0] == mtime_ns  and  cached[1] == size:
+        return cached[2]
+    with open(path, 'rb') as ifile:
+        text = ifile.read().decode('utf-8', errors='replace')
+    _template_cache.pop(path, None)
+    if len(_template_cache) >= _TEMPLATE_CACHE_MAX:
+        del _template_cache[next(iter(_template_cache))]        # Drop the oldest
+    _template_cache[path] = (mtime_ns, size, text)
+    return text
+
+
+@functools.lru_cache(maxsize=32)
+def _split_list(items):
+    """Return tuple of the items in comma or whitespace separated string 'items'.
+    """
+    if ',' in items:
+        return tuple(item.strip() for item in items.split(','))
+    return tuple(items.split())
+
+
+def _resolve_to(to):
+    """Return the tuple of addresses for 'to', which is an address string, a config keyword
+    string, or an already resolved tuple/list of addresses.
+    """
+    if not isinstance(to, str):
+        return tuple(to)
+    if '@' in to:
+        return _split_list(to)
+    return getcfg_list(to, ())
+
+
+def _get_to_list(to, subj):
+    """Return the tuple of email addresses for the snd_email 'to' parameter.
+
+    Raises SndEmailError if the list is empty or an address is invalid.
+    """
+    To = _resolve_to(to)
+    where = f"snd_email - Message subject <{subj}>"  if subj is not None  else "resolve_recipients"
+    if not To:
+        _msg = f"{where}:  'to' list must not be empty."
+        raise SndEmailError (_msg)
+    for address in To:
+        if '@' not in address:
+            _msg = f"{where}:  address in 'to' list is invalid: <{address}>."
+            raise SndEmailError (_msg)
+    return To
+
+
+def resolve_recipients(to):
+    """Return the tuple of email addresses for a snd_email/snd_notif 'to' parameter.
+
+    to
+        An explicit string list of email addresses (whitespace or comma separated) or the name
+        of a config file keyword, as for snd_email.
+
+    A script that sends repeatedly to the same recipients may resolve 'to' once and pass the
+    returned tuple as the 'to' parameter of later snd_notif/snd_email calls.  A tuple resolved
+    from a config keyword does not follow later config file reloads.
+
+    Raises SndEmailError if the list is empty or an address is invalid.
+    """
+    return _get_to_list(to, None)
+
+
 def snd_notif(subj='Notification message', msg='', to='NotifList', log=False):
     """Send a text message using the cfg NotifList.
 
@@ -500,7 +984,8 @@ def snd_notif(subj='Notification message', msg='', to='NotifList', log=False):
         To whom to send the message.  'to' may be either an explicit string list of email addresses
         (whitespace or comma separated) or the name of a config file keyword (also listing one
         or more whitespace/comma separated email addresses).  If the 'to' parameter does not
-        contain an '@' it is assumed to be a config keyword - default 'NotifList'.
+        contain an '@' it is assumed to be a config keyword - default 'NotifList'.  'to' may also be
+        a tuple of addresses as returned by resolve_recipients.
     log
         If True, elevates log level from DEBUG to WARNING to force logging
 
@@ -510,18 +995,13 @@ def snd_notif(subj='Notification message', msg='', to='NotifList', log=False):
     Raises SndEmailError on call errors and sendmail errors
     """
 
-    if getcfg('DontNotif', default=False)  or  getcfg('DontEmail', default=False):
-        if log:
-            logging.warning (f"Notification NOT sent <{subj}> <{msg}>")
-        else:
-            logging.debug (f"Notification NOT sent <{subj}> <{msg}>")
+    level = logging.WARNING  if log  else logging.DEBUG
+    if cfg.get('DontNotif')  or  cfg.get('DontEmail'):
+        logging.log (level, "Notification NOT sent <%s> <%s>", subj, msg)
         return
 
-    snd_email (subj=subj, body=msg, to=to)
-    if log:
-        logging.warning (f"Notification sent <{subj}> <{msg}>")
-    else:
-        logging.debug (f"Notification sent <{subj}> <{msg}>")
+    _send_text (subj, msg, "plain", to)
+    logging.log (level, "Notification sent <%s> <%s>", subj, msg)
 
 
 def snd_email(subj='', body='', filename='', htmlfile='', to='', log=False):
@@ -545,7 +1025,8 @@ def snd_email(subj='', body='', filename='', htmlfile='', to='', log=False):
         To whom to send the message.  'to' may be either an explicit string list of email addresses
         (whitespace or comma separated) or the name of a config file keyword (also listing one
         or more whitespace/comma separated email addresses).  If the 'to' parameter does not
-        contain an '@' it is assumed to be a config keyword - no default.
+        contain an '@' it is assumed to be a config keyword - no default.  'to' may also be
+        a tuple of addresses as returned by resolve_recipients.
     log
         If True, elevates log level from DEBUG to WARNING to force logging of the email subj
 
@@ -562,95 +1043,187 @@ def snd_email(subj='', body='', filename='', htmlfile='', to='', log=False):
         Also blocks snd_notifs.  Useful for debug.
     cfg EmailVerbose = True enables the emailer debug level.
 
+    The SMTP connection is kept open and reused by following snd_email calls (reconnecting if
+    idle for more than _SMTP_IDLE_TIMEOUT seconds or dropped by the server), and is closed at exit
+    or by close_smtp().
+
     Raises SndEmailError on call errors and sendmail errors
     """
 
-    if getcfg('DontEmail', default=False):
-        if log:
-            logging.warning (f"Email NOT sent <{subj}>")
-        else:
-            logging.debug (f"Email NOT sent <{subj}>")
+    level = logging.WARNING  if log  else logging.DEBUG
+    if cfg.get('DontEmail'):
+        logging.log (level, "Email NOT sent <%s>", subj)
         return
 
     # Deal with what to send
+    m_text = None
     if body != '':
         msg_type = "plain"
         m_text = body
-    elif os.path.exists(filename):
-        msg_type = "plain"
-        with io.open(filename, encoding='utf8') as ifile:
-            m_text = ifile.read()
-    elif os.path.exists(htmlfile):
-        msg_type = "html"
-        with io.open(htmlfile, encoding='utf8') as ifile:
-            m_text = ifile.read()
     else:
+        for msg_type, path in (("plain", filename), ("html", htmlfile)):
+            if path:
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                m_text = _read_template(path, st.st_mtime_ns, st.st_size)
+                break
+    if m_text is None:
         _msg = f"snd_email - Message subject <{subj}>:  No body and can't find filename <{filename}> or htmlfile <{htmlfile}>."
         raise SndEmailError (_msg)
-    m_text += f"\n(sent {time.asctime(time.localtime())})"
 
-    # Deal with 'to'
-    def extract_email_addresses(addresses):
-        """Return list of email addresses from comma or whitespace separated string 'addresses'.
-        """
-        if ',' in addresses:
-            tmp = addresses.split(',')
-            addrs = []
-            for addr in tmp:
-                addrs.append(addr.strip())
-        else:
-            addrs = addresses.split()
-        return addrs
+    _send_text (subj, m_text, msg_type, to)
+    logging.log (level, "Email sent <%s>", subj)
 
-    if '@' in to:
-        To = extract_email_addresses(to)
-    else:
-        To = extract_email_addresses(getcfg(to, ""))
-    if len(To) == 0:
-        _msg = f"snd_email - Message subject <{subj}>:  'to' list must not be empty."
-        raise SndEmailError (_msg)
-    for address in To:
-        if '@' not in address:
-            _msg = f"snd_email - Message subject <{subj}>:  address in 'to' list is invalid: <{address}>."
-            raise SndEmailError (_msg)
+
+def _send_text(subj, m_text, msg_type, to, from_addr=None):
+    """Send m_text, with the sent time appended, as the msg_type ("plain" or "html") body.
+    Common to snd_notif, snd_email, and make_sender, which have already checked for DontNotif/DontEmail.
+
+    If from_addr is given (by make_sender) then 'to' is an already checked tuple of addresses.
+    Otherwise 'to' is resolved and checked, and EmailFrom is read from cfg.
+
+    Raises SndEmailError on 'to' errors and sendmail errors
+    """
+    m_text += f"\n(sent {_asctime_for(int(time.time()))})"
+
+    To = to  if from_addr is not None  else _get_to_list(to, subj)
 
     # Send the message
     try:
-        msg = MIMEText(m_text, msg_type)
+        cfg_from = from_addr  if from_addr is not None  else getcfg('EmailFrom')
+        msg = _new_message(cfg_from, To)
         msg['Subject'] = subj
-        msg['From'] = getcfg('EmailFrom')
-        msg['To'] = ", ".join(To)
-
-        cfg_server = getcfg('EmailServer')
-        cfg_port   = getcfg('EmailServerPort')
-        if cfg_port == "P25":
-            server = smtplib.SMTP(cfg_server, 25)
-        elif cfg_port == "P465":
-            server = smtplib.SMTP_SSL(cfg_server, 465)
-        elif cfg_port == "P587":
-            server = smtplib.SMTP(cfg_server, 587)
-        elif cfg_port == "P587TLS":
-            server = smtplib.SMTP(cfg_server, 587)
-            server.starttls()
-        else:
-            raise ConfigError (f"Config EmailServerPort <{cfg_port}> is invalid")
-
-        if 'EmailUser' in cfg:
-            server.login (getcfg('EmailUser'), getcfg('EmailPass'))
-        if getcfg("EmailVerbose", False):
-            server.set_debuglevel(1)
-        server.sendmail(getcfg('EmailFrom'), To, msg.as_string())
-        server.quit()
-
-        if log:
-            logging.warning (f"Email sent <{subj}>")
-        else:
-            logging.debug (f"Email sent <{subj}>")
+        _set_body(msg, m_text, msg_type)
+        _sendmail(cfg_from, To, msg)
     except Exception as e:
         _msg = f"snd_email:  Send failed for <{subj}>:\n  <{e}>"
         raise SndEmailError (_msg)
 
 
+def snd_email_many(batch, log=False):
+    """Send a batch of plain text email messages over one SMTP connection.
+
+    batch
+        Iterable of (subj, body, to) tuples, with subj, body, and to as for snd_email
+    log
+        If True, elevates log level from DEBUG to WARNING to force logging of each email subj
+
+    Each message is sent as its own SMTP transaction on the shared connection, without a NOOP
+    check between messages.  A message that can't be sent (eg, invalid 'to' or refused
+    recipients) is logged at WARNING level and skipped, with the connection reset for the next
+    message, so that one bad address doesn't stop the batch.  If the number of failed
+    messages exceeds max(10, 1/3 of the batch) the remainder of the batch is abandoned.
+    Config, connection, and login failures affect every message, and abandon the batch at once
+    (rather than reconnecting and logging in again for each message).
+
+    cfg params are as for snd_email.  If cfg DontEmail == True no emails are sent.
+
+    Returns the number of messages sent.
+    Raises SndEmailError if the batch is abandoned.
+    """
+
+    batch = list(batch)
+    level = logging.WARNING  if log  else logging.DEBUG
+    if cfg.get('DontEmail'):
+        for subj, body, to in batch:
+            logging.log (level, "Email NOT sent <%s>", subj)
+        return 0
+
+    import smtplib
+    message_errors = (SndEmailError, smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)
+
+    max_failures = max(10, len(batch)//3)
+    failures = 0
+    sent = 0
+    for subj, body, to in batch:
+        try:
+            To = _get_to_list(to, subj)
+            cfg_from = getcfg('EmailFrom')
+            msg = _new_message(cfg_from, To)
+            msg['Subject'] = subj
+            _set_body(msg, body + f"\n(sent {_asctime_for(int(time.time()))})")
+            _sendmail(cfg_from, To, msg)
+        except message_errors as e:                 # Problems with just this message
+            failures += 1
+            logging.warning ("snd_email_many:  Send failed for <%s>:\n  <%s>", subj, e)
+            if failures > max_failures:
+                _msg = f"snd_email_many:  Batch abandoned after {failures} failed messages ({sent} sent)."
+                raise SndEmailError (_msg)
+            continue
+        except Exception as e:                      # Config, connection, or login problems affect every message
+            _msg = f"snd_email_many:  Send failed for <{subj}>, batch abandoned ({sent} sent):\n  <{e}>"
+            raise SndEmailError (_msg)
+        sent += 1
+        logging.log (level, "Email sent <%s>", subj)
+    return sent
+
+
+def make_sender(to, log=False):
+    """Return a send(subj, body) function that sends plain text emails to 'to'.
+
+    to
+        As for snd_email.  Resolved and checked once, by make_sender.
+    log
+        If True, elevates log level from DEBUG to WARNING to force logging of each email subj
+
+    For scripts that repeatedly send to the same recipients.  The recipients and cfg EmailFrom
+    are looked up when make_sender is called (call make_sender again after a config reload), so
+    each send only builds and sends the message.  cfg DontEmail is honored as for snd_email.
+
+    send raises SndEmailError on sendmail errors.
+    make_sender raises SndEmailError if the 'to' list is empty or an address is invalid, or if
+    cfg EmailFrom is missing.
+    """
+
+    To = resolve_recipients(to)
+    try:
+        from_addr = getcfg('EmailFrom')
+    except ConfigError as e:
+        raise SndEmailError (f"make_sender:  {e}") from None
+    level = logging.WARNING  if log  else logging.DEBUG
+
+    def send(subj, body):
+        if cfg.get('DontEmail'):
+            logging.log (level, "Email NOT sent <%s>", subj)
+            return
+        _send_text (subj, body, "plain", To, from_addr)
+        logging.log (level, "Email sent <%s>", subj)
+
+    return send
+
+
+def _run_in_executor(function, **kwargs):
+    """Call function(**kwargs) in an executor thread, then close the thread's SMTP connection."""
+    try:
+        function(**kwargs)
+    finally:
+        _close_thread_smtp()
+
+
+async def snd_notif_async(subj='Notification message', msg='', to='NotifList', log=False):
+    """asyncio version of snd_notif.  Parameters, cfg params, and exceptions are as for snd_notif.
+
+    The send runs in the event loop's default executor, so notifications and emails sent together
+    with asyncio.gather() overlap their SMTP dialogs.  Each executor thread uses its own SMTP connection,
+    which is closed when the send is done.
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, functools.partial(_run_in_executor, snd_notif, subj=subj, msg=msg, to=to, log=log))
+
+
+async def snd_email_async(subj='', body='', filename='', htmlfile='', to='', log=False):
+    """asyncio version of snd_email.  Parameters, cfg params, and exceptions are as for snd_email.
+
+    See snd_notif_async.
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, functools.partial(_run_in_executor, snd_email, subj=subj, body=body, filename=filename, htmlfile=htmlfile, to=to, log=log))
+
+
 if __name__ == '__main__':
 
     loadconfig (cfgfile='testcfg.cfg', cfgloglevel=10)